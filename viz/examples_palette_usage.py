@@ -6,9 +6,10 @@ This script demonstrates how to use the viz.palettes module to create
 colorblind-friendly visualizations with various plotting libraries.
 """
 
-# Import the palette module
+import io
 import sys
-sys.path.insert(0, '.')
+
+# Import the palette module
 from viz.palettes import (
     get_categorical_palette,
     get_continuous_colormap,
@@ -17,29 +18,36 @@ from viz.palettes import (
     set_plotly_palette,
     get_altair_scale,
     set_global_palettes,
+    generate_css_variables,
 )
 
-print("=" * 70)
-print("Colorblind-Friendly Palette Examples")
-print("=" * 70)
-
-# Example 1: Get palette colors
-print("\n1. Getting palette colors:")
-print("-" * 70)
-okabe_ito = get_categorical_palette('okabe_ito')
-print(f"Okabe-Ito palette ({len(okabe_ito)} colors):")
-for i, color in enumerate(okabe_ito, 1):
-    print(f"  {i}. {color}")
-
-paul_tol = get_categorical_palette('paul_tol_muted', n=4)
-print(f"\nPaul Tol Muted palette (first 4 colors):")
-for i, color in enumerate(paul_tol, 1):
-    print(f"  {i}. {color}")
-
-# Example 2: Matplotlib usage
-print("\n2. Matplotlib usage:")
-print("-" * 70)
-print("""
+_HR = "=" * 70
+_SUB_HR = "-" * 70
+
+
+def _palette_colors_example():
+    """Example 1: list the colors of a couple of palettes."""
+    okabe_ito = get_categorical_palette('okabe_ito')
+    paul_tol = get_categorical_palette('paul_tol_muted', n=4)
+    return "\n".join([
+        f"Okabe-Ito palette ({len(okabe_ito)} colors):",
+        *(f"  {i}. {color}" for i, color in enumerate(okabe_ito, 1)),
+        "",
+        "Paul Tol Muted palette (first 4 colors):",
+        *(f"  {i}. {color}" for i, color in enumerate(paul_tol, 1)),
+    ])
+
+
+def _css_variables_example():
+    """Example 7: generate CSS variables for web use."""
+    css = generate_css_variables('okabe_ito', prefix='color-okabe')
+    return f"CSS Variables:\n{css}"
+
+
+# Example sections as (title, body); callable bodies produce dynamic output
+_SECTIONS = (
+    ("1. Getting palette colors:", _palette_colors_example),
+    ("2. Matplotlib usage:", """
 import matplotlib.pyplot as plt
 from viz.palettes import apply_matplotlib_palette
 
@@ -52,12 +60,8 @@ for i in range(4):
     ax.plot([0, 1, 2], [i, i+1, i+2], label=f'Series {i+1}')
 ax.legend()
 plt.show()
-""")
-
-# Example 3: Seaborn usage
-print("\n3. Seaborn usage:")
-print("-" * 70)
-print("""
+"""),
+    ("3. Seaborn usage:", """
 import seaborn as sns
 from viz.palettes import set_seaborn_palette
 
@@ -67,12 +71,8 @@ set_seaborn_palette('paul_tol_muted')
 tips = sns.load_dataset('tips')
 sns.scatterplot(data=tips, x='total_bill', y='tip', hue='day')
 plt.show()
-""")
-
-# Example 4: Plotly usage
-print("\n4. Plotly usage:")
-print("-" * 70)
-print("""
+"""),
+    ("4. Plotly usage:", """
 import plotly.express as px
 from viz.palettes import set_plotly_palette
 
@@ -82,12 +82,8 @@ set_plotly_palette('okabe_ito')
 df = px.data.iris()
 fig = px.scatter(df, x='sepal_width', y='sepal_length', color='species')
 fig.show()
-""")
-
-# Example 5: Altair usage
-print("\n5. Altair usage:")
-print("-" * 70)
-print("""
+"""),
+    ("5. Altair usage:", """
 import altair as alt
 from viz.palettes import get_altair_scale
 
@@ -101,32 +97,17 @@ chart = alt.Chart(source).mark_point().encode(
     color=alt.Color('Origin:N', scale=get_altair_scale('okabe_ito'))
 )
 chart.show()
-""")
-
-# Example 6: Set global palettes
-print("\n6. Set palettes globally for multiple libraries:")
-print("-" * 70)
-print("""
+"""),
+    ("6. Set palettes globally for multiple libraries:", """
 from viz.palettes import set_global_palettes
 
 # Set Okabe-Ito palette for matplotlib and seaborn
 set_global_palettes('okabe_ito', matplotlib_enabled=True, seaborn_enabled=True)
 
 # Now all plots will use the colorblind-friendly palette
-""")
-
-# Example 7: Generate CSS variables
-print("\n7. Generate CSS variables for web use:")
-print("-" * 70)
-from viz.palettes import generate_css_variables
-css = generate_css_variables('okabe_ito', prefix='color-okabe')
-print("CSS Variables:")
-print(css)
-
-# Example 8: Using in Vega-Lite specs
-print("\n8. Using in Vega-Lite/Altair specifications:")
-print("-" * 70)
-print("""
+"""),
+    ("7. Generate CSS variables for web use:", _css_variables_example),
+    ("8. Using in Vega-Lite/Altair specifications:", """
 from viz.palettes import get_categorical_palette
 
 colors = get_categorical_palette('okabe_ito', n=4)
@@ -145,12 +126,8 @@ vega_spec = {
         }
     }
 }
-""")
-
-# Example 9: Continuous colormaps
-print("\n9. Continuous colormaps for heatmaps and gradients:")
-print("-" * 70)
-print("""
+"""),
+    ("9. Continuous colormaps for heatmaps and gradients:", """
 from viz.palettes import get_continuous_colormap
 import matplotlib.pyplot as plt
 import numpy as np
@@ -163,13 +140,22 @@ data = np.random.randn(10, 10)
 plt.imshow(data, cmap=cmap)
 plt.colorbar()
 plt.show()
-""")
+"""),
+)
 
-print("\n" + "=" * 70)
-print("For more information, see ACCESSIBILITY.md")
-print("=" * 70)
 
-# Test that the module works
 if __name__ == "__main__":
-    print("\n✓ All examples loaded successfully!")
-    print("✓ Palette module is working correctly")
+    buf = io.StringIO()
+    buf.write(f"{_HR}\nColorblind-Friendly Palette Examples\n{_HR}\n")
+
+    for title, body in _SECTIONS:
+        text = body() if callable(body) else body
+        buf.write(f"\n{title}\n{_SUB_HR}\n{text}\n")
+
+    buf.write(f"\n{_HR}\nFor more information, see ACCESSIBILITY.md\n{_HR}\n")
+
+    # Test that the module works
+    buf.write("\n✓ All examples loaded successfully!\n")
+    buf.write("✓ Palette module is working correctly\n")
+
+    sys.stdout.write(buf.getvalue())
@@ -9,9 +9,70 @@ Author: Visual Data Science Team
 Date: 2026-01-18
 """
 
+import copy
+import functools
+import importlib.util
+import operator
+import sys
+
+# Optional dependencies. Availability is checked without importing them;
+# each library is imported by its _load_* helper on first use
+_np = None
+_mpl = None
+_cycler = None
+_sns = None
+_px = None
+_alt = None
+
+_HAS_NP = importlib.util.find_spec('numpy') is not None
+_HAS_MPL = (
+    importlib.util.find_spec('matplotlib') is not None
+    and importlib.util.find_spec('cycler') is not None
+)
+_HAS_SNS = importlib.util.find_spec('seaborn') is not None
+_HAS_PX = importlib.util.find_spec('plotly') is not None
+_HAS_ALT = importlib.util.find_spec('altair') is not None
+
+
+def _load_numpy():
+    """Import numpy on first use."""
+    global _np
+    if _np is None:
+        import numpy as _np
+
+
+def _load_matplotlib():
+    """Import matplotlib and cycler on first use."""
+    global _mpl, _cycler
+    if _mpl is None:
+        from cycler import cycler as _cycler
+        import matplotlib as _mpl
+
+
+def _load_seaborn():
+    """Import seaborn on first use."""
+    global _sns
+    if _sns is None:
+        import seaborn as _sns
+
+
+def _load_plotly():
+    """Import plotly.express on first use."""
+    global _px
+    if _px is None:
+        import plotly.express as _px
+
+
+def _load_altair():
+    """Import altair on first use."""
+    global _alt
+    if _alt is None:
+        import altair as _alt
+
+
 # Okabe-Ito categorical palette (colorblind-safe)
 # Source: https://jfly.uni-koeln.de/color/
-OKABE_ITO = [
+OKABE_ITO = (
     "#E69F00",  # Orange
     "#56B4E9",  # Sky Blue
     "#009E73",  # Bluish Green
@@ -20,10 +81,10 @@ OKABE_ITO = [
     "#D55E00",  # Vermillion
     "#CC79A7",  # Reddish Purple
     "#000000",  # Black
-]
+)
 
 # ColorBrewer Dark2 palette (colorblind-friendly)
-COLORBREWER_DARK2 = [
+COLORBREWER_DARK2 = (
     "#1B9E77",  # Teal
     "#D95F02",  # Orange
     "#7570B3",  # Purple
@@ -32,10 +93,10 @@ COLORBREWER_DARK2 = [
     "#E6AB02",  # Yellow
     "#A6761D",  # Brown
     "#666666",  # Gray
-]
+)
 
 # Paul Tol's vibrant palette (colorblind-safe)
-PAUL_TOL_VIBRANT = [
+PAUL_TOL_VIBRANT = (
     "#EE7733",  # Orange
     "#0077BB",  # Blue
     "#33BBEE",  # Cyan
@@ -43,10 +104,10 @@ PAUL_TOL_VIBRANT = [
     "#CC3311",  # Red
     "#009988",  # Teal
     "#BBBBBB",  # Gray
-]
+)
 
 # Paul Tol's muted palette (colorblind-safe, professional)
-PAUL_TOL_MUTED = [
+PAUL_TOL_MUTED = (
     "#CC6677",  # Rose
     "#332288",  # Indigo
     "#DDCC77",  # Sand
@@ -56,10 +117,10 @@ PAUL_TOL_MUTED = [
     "#44AA99",  # Teal
     "#999933",  # Olive
     "#AA4499",  # Purple
-]
+)
 
 # Sequential colormaps (all colorblind-friendly)
-CONTINUOUS_COLORMAPS = [
+CONTINUOUS_COLORMAPS = (
     "viridis",    # Blue to yellow
     "plasma",     # Purple to yellow
     "inferno",    # Black to yellow
@@ -68,16 +129,66 @@ CONTINUOUS_COLORMAPS = [
     "blues",      # Light to dark blue
     "oranges",    # Light to dark orange
     "purples",    # Light to dark purple
-]
+)
 
 # Diverging colormaps (colorblind-friendly)
-DIVERGING_COLORMAPS = [
+DIVERGING_COLORMAPS = (
     "BrBG",       # Brown to blue-green (ColorBrewer)
     "PuOr",       # Purple to orange (ColorBrewer)
     "coolwarm",   # Blue to red (but distinguishable)
-]
+)
+
+# Intern color and colormap strings so hashing and comparisons in
+# downstream dict/set lookups reuse the cached hash
+OKABE_ITO = tuple(sys.intern(c) for c in OKABE_ITO)
+COLORBREWER_DARK2 = tuple(sys.intern(c) for c in COLORBREWER_DARK2)
+PAUL_TOL_VIBRANT = tuple(sys.intern(c) for c in PAUL_TOL_VIBRANT)
+PAUL_TOL_MUTED = tuple(sys.intern(c) for c in PAUL_TOL_MUTED)
+CONTINUOUS_COLORMAPS = tuple(sys.intern(c) for c in CONTINUOUS_COLORMAPS)
+DIVERGING_COLORMAPS = tuple(sys.intern(c) for c in DIVERGING_COLORMAPS)
+
+# Set of continuous colormap names for constant-time validation
+_CONTINUOUS_SET = frozenset(CONTINUOUS_COLORMAPS)
+
+# Lookup table of categorical palettes by name
+_PALETTES = {
+    'okabe_ito': OKABE_ITO,
+    'colorbrewer_dark2': COLORBREWER_DARK2,
+    'paul_tol_vibrant': PAUL_TOL_VIBRANT,
+    'paul_tol_muted': PAUL_TOL_MUTED,
+}
+
+# Number of colors precomputed for cycled palettes
+_MAX_CYCLED_COLORS = 256
+
+# Palettes cycled out to _MAX_CYCLED_COLORS entries, so that requests for
+# more colors than a palette holds become a plain slice
+_PALETTES_EXT = {
+    name: tuple(palette[i % len(palette)] for i in range(_MAX_CYCLED_COLORS))
+    for name, palette in _PALETTES.items()
+}
+
+# Palettes as (r, g, b) integer tuples, parsed once from the hex codes
+_PALETTES_RGB = {
+    name: tuple(
+        (int(c[1:3], 16), int(c[3:5], 16), int(c[5:7], 16)) for c in palette
+    )
+    for name, palette in _PALETTES.items()
+}
 
 
+@functools.lru_cache(maxsize=None)
+def _get_rgb_arrays(name):
+    """Build (once per palette) read-only (n, 3) uint8 and float32 arrays."""
+    rgb = _np.frombuffer(
+        bytes.fromhex("".join(c.lstrip("#") for c in _PALETTES[name])), dtype=_np.uint8
+    ).reshape(-1, 3)
+    rgb_f32 = rgb.astype(_np.float32) / _np.float32(255.0)
+    rgb_f32.flags.writeable = False
+    return {'uint8': rgb, 'float32': rgb_f32}
+
+
+@functools.lru_cache(maxsize=128)
 def get_categorical_palette(name='okabe_ito', n=None):
     """
     Get a categorical color palette by name.
@@ -93,34 +204,184 @@ def get_categorical_palette(name='okabe_ito', n=None):
     
     Returns
     -------
-    list of str
-        List of hex color codes
+    tuple of str
+        Tuple of hex color codes. Results are cached, so the returned
+        tuple is shared between callers; use ``list(...)`` if a mutable
+        copy is needed.
     
     Examples
     --------
     >>> palette = get_categorical_palette('okabe_ito', n=4)
     >>> print(palette)
-    ['#E69F00', '#56B4E9', '#009E73', '#F0E442']
+    ('#E69F00', '#56B4E9', '#009E73', '#F0E442')
     """
-    palettes = {
-        'okabe_ito': OKABE_ITO,
-        'colorbrewer_dark2': COLORBREWER_DARK2,
-        'paul_tol_vibrant': PAUL_TOL_VIBRANT,
-        'paul_tol_muted': PAUL_TOL_MUTED,
-    }
-    
-    if name not in palettes:
-        raise ValueError(f"Unknown palette '{name}'. Available: {list(palettes.keys())}")
-    
-    palette = palettes[name]
+    try:
+        palette = _PALETTES[name]
+    except KeyError:
+        raise ValueError(f"Unknown palette '{name}'. Available: {list(_PALETTES.keys())}") from None
     
     if n is None:
         return palette
     elif n <= len(palette):
         return palette[:n]
+    elif n <= _MAX_CYCLED_COLORS:
+        return _PALETTES_EXT[name][:n]
     else:
         # Cycle through palette if n is larger
-        return [palette[i % len(palette)] for i in range(n)]
+        return tuple(palette[i % len(palette)] for i in range(n))
+
+
+@functools.lru_cache(maxsize=64)
+def get_categorical_palette_rgb(name='okabe_ito', n=None, dtype=None):
+    """
+    Get a categorical color palette as RGB values.
+    
+    Parameters
+    ----------
+    name : str, optional
+        Name of the palette. See `get_categorical_palette` for options.
+        Default is 'okabe_ito'.
+    n : int, optional
+        Number of colors to return. If None, returns all colors in palette.
+        If n is larger than palette size, cycles through palette.
+    dtype : {None, 'uint8', 'float32'}, optional
+        If None (default), returns a tuple of (r, g, b) integer tuples.
+        Otherwise returns a read-only NumPy array of shape (n, 3): 'uint8'
+        gives components in the range 0-255, 'float32' normalizes them to
+        0-1. Array output requires numpy.
+    
+    Returns
+    -------
+    tuple of tuple of int or numpy.ndarray
+        RGB values of the palette colors
+    
+    Examples
+    --------
+    >>> get_categorical_palette_rgb('okabe_ito', n=2)
+    ((230, 159, 0), (86, 180, 233))
+    >>> get_categorical_palette_rgb('okabe_ito', n=2, dtype='uint8')
+    array([[230, 159,   0],
+           [ 86, 180, 233]], dtype=uint8)
+    """
+    try:
+        palette = _PALETTES_RGB[name]
+    except KeyError:
+        raise ValueError(f"Unknown palette '{name}'. Available: {list(_PALETTES_RGB.keys())}") from None
+    
+    if dtype is None:
+        if n is None:
+            return palette
+        elif n <= len(palette):
+            return palette[:n]
+        else:
+            # Cycle through palette if n is larger
+            return tuple(palette[i % len(palette)] for i in range(n))
+    
+    if not _HAS_NP:
+        raise ImportError("numpy is required for array output")
+    _load_numpy()
+    
+    try:
+        arr = _get_rgb_arrays(name)[_np.dtype(dtype).name]
+    except (TypeError, KeyError):
+        raise ValueError(f"Unsupported dtype {dtype!r}. Available: ['uint8', 'float32']") from None
+    
+    if n is None or n <= len(arr):
+        return arr[:n]
+    # Cycle through palette if n is larger; results are cached, so keep
+    # them read-only like the precomputed arrays
+    cycled = arr[_np.arange(n) % len(arr)]
+    cycled.flags.writeable = False
+    return cycled
+
+
+def _srgb_to_lab(rgb):
+    """Convert an (n, 3) array of 0-255 sRGB values to CIE L*a*b* (D65)."""
+    c = _np.asarray(rgb, dtype=_np.float64) / 255.0
+    linear = _np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ _np.array([
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]).T
+    t = xyz / _np.array([0.95047, 1.0, 1.08883])
+    f = _np.where(t > (6 / 29) ** 3, _np.cbrt(t), t / (3 * (6 / 29) ** 2) + 4 / 29)
+    return _np.stack([
+        116 * f[:, 1] - 16,
+        500 * (f[:, 0] - f[:, 1]),
+        200 * (f[:, 1] - f[:, 2]),
+    ], axis=1)
+
+
+# Nearest-palette-color lookup tables, built on first use per palette and
+# indexed by a 5:5:5 quantized RGB key
+_NEAREST_LUTS = {}
+
+
+def _build_nearest_lut(palette_name):
+    """Map every 5:5:5 RGB cell to its nearest palette entry (CIE76 Delta E)."""
+    keys = _np.arange(32768)
+    # Use the center of each quantization cell as its representative color
+    cells = _np.stack([(keys >> 10) & 31, (keys >> 5) & 31, keys & 31], axis=1) * 8 + 4
+    cells_lab = _srgb_to_lab(cells)
+    palette_lab = _srgb_to_lab(_get_rgb_arrays(palette_name)['uint8'])
+    dist = ((cells_lab[:, None, :] - palette_lab[None, :, :]) ** 2).sum(axis=2)
+    lut = dist.argmin(axis=1).astype(_np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def nearest_palette_index(r, g, b, palette_name='okabe_ito'):
+    """
+    Find the palette color perceptually closest to an RGB color.
+    
+    Distances are CIE76 Delta E in L*a*b* space. Lookups go through a
+    32768-entry table over 5 bits per channel, built on the first call for
+    each palette, so colors within the same 8x8x8 cell share a result.
+    
+    Parameters
+    ----------
+    r, g, b : int
+        Color components in the range 0-255. Any integer type is accepted,
+        including NumPy uint8 pixel components; floats, strings, bools and
+        other non-integer values raise TypeError.
+    palette_name : str, optional
+        Name of the palette. Default is 'okabe_ito'.
+    
+    Returns
+    -------
+    int
+        Index of the nearest color in the palette
+    
+    Examples
+    --------
+    >>> nearest_palette_index(255, 140, 0)  # dark orange
+    0
+    >>> get_categorical_palette('okabe_ito')[0]
+    '#E69F00'
+    >>> pixel = get_categorical_palette_rgb('okabe_ito', dtype='uint8')[5]
+    >>> nearest_palette_index(*pixel)
+    5
+    """
+    if not _HAS_NP:
+        raise ImportError("numpy is required for this function")
+    _load_numpy()
+    
+    # Shift in Python ints; NumPy uint8 components would overflow
+    if any(isinstance(c, bool) for c in (r, g, b)):
+        raise TypeError("RGB components must be integers, not bool")
+    r, g, b = operator.index(r), operator.index(g), operator.index(b)
+    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+        raise ValueError(f"RGB components must be in the range 0-255, got ({r}, {g}, {b})")
+    
+    try:
+        lut = _NEAREST_LUTS[palette_name]
+    except KeyError:
+        if palette_name not in _PALETTES:
+            raise ValueError(f"Unknown palette '{palette_name}'. Available: {list(_PALETTES.keys())}") from None
+        lut = _NEAREST_LUTS[palette_name] = _build_nearest_lut(palette_name)
+    
+    return int(lut[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)])
 
 
 def get_continuous_colormap(name='viridis'):
@@ -142,9 +403,47 @@ def get_continuous_colormap(name='viridis'):
     >>> cmap = get_continuous_colormap('viridis')
     >>> plt.imshow(data, cmap=cmap)
     """
-    if name not in CONTINUOUS_COLORMAPS:
-        raise ValueError(f"Unknown colormap '{name}'. Available: {CONTINUOUS_COLORMAPS}")
-    return name
+    try:
+        if name in _CONTINUOUS_SET:
+            return name
+    except TypeError:
+        # Unhashable input (e.g. a list) is simply not a known colormap
+        pass
+    raise ValueError(f"Unknown colormap '{name}'. Available: {list(CONTINUOUS_COLORMAPS)}")
+
+
+def is_valid_continuous_colormap(name):
+    """
+    Check whether a name is a supported continuous colormap.
+    
+    Parameters
+    ----------
+    name : str
+        Colormap name to check.
+    
+    Returns
+    -------
+    bool
+        True if `get_continuous_colormap` accepts the name, False otherwise
+        (including for non-string or unhashable input).
+    
+    Examples
+    --------
+    >>> is_valid_continuous_colormap('viridis')
+    True
+    >>> is_valid_continuous_colormap('jet')
+    False
+    """
+    try:
+        return name in _CONTINUOUS_SET
+    except TypeError:
+        return False
+
+
+@functools.lru_cache(maxsize=16)
+def _get_color_cycler(palette_name):
+    """Build (once per palette) a matplotlib color cycler."""
+    return _cycler(color=get_categorical_palette(palette_name))
 
 
 def apply_matplotlib_palette(ax=None, palette_name='okabe_ito'):
@@ -167,20 +466,19 @@ def apply_matplotlib_palette(ax=None, palette_name='okabe_ito'):
     >>> fig, ax = plt.subplots()
     >>> apply_matplotlib_palette(ax=ax, palette_name='paul_tol_muted')
     """
-    try:
-        import matplotlib.pyplot as plt
-        from cycler import cycler
-    except ImportError:
+    if not _HAS_MPL:
         raise ImportError("matplotlib and cycler are required for this function")
+    _load_matplotlib()
     
-    palette = get_categorical_palette(palette_name)
+    color_cycler = _get_color_cycler(palette_name)
     
     if ax is None:
-        # Apply globally
-        plt.rcParams['axes.prop_cycle'] = cycler(color=palette)
+        # Apply globally. rcParams keeps the object as-is and Cycler's += / *=
+        # mutate in place, so hand over a copy to protect the cached cycler
+        _mpl.rcParams['axes.prop_cycle'] = copy.copy(color_cycler)
     else:
         # Apply to specific axes
-        ax.set_prop_cycle(cycler(color=palette))
+        ax.set_prop_cycle(color_cycler)
 
 
 def set_seaborn_palette(palette_name='okabe_ito'):
@@ -198,13 +496,12 @@ def set_seaborn_palette(palette_name='okabe_ito'):
     >>> set_seaborn_palette('paul_tol_muted')
     >>> sns.scatterplot(data=df, x='x', y='y', hue='category')
     """
-    try:
-        import seaborn as sns
-    except ImportError:
+    if not _HAS_SNS:
         raise ImportError("seaborn is required for this function")
+    _load_seaborn()
     
     palette = get_categorical_palette(palette_name)
-    sns.set_palette(palette)
+    _sns.set_palette(palette)
 
 
 def set_plotly_palette(palette_name='okabe_ito'):
@@ -222,13 +519,21 @@ def set_plotly_palette(palette_name='okabe_ito'):
     >>> set_plotly_palette('paul_tol_vibrant')
     >>> fig = px.scatter(df, x='x', y='y', color='category')
     """
-    try:
-        import plotly.express as px
-    except ImportError:
+    if not _HAS_PX:
         raise ImportError("plotly is required for this function")
+    _load_plotly()
     
     palette = get_categorical_palette(palette_name)
-    px.defaults.color_discrete_sequence = palette
+    
+    # Skip rebinding the default when this palette is already active. The
+    # comparison is by value and plotly gets its own list, so in-place edits
+    # to px.defaults never leak into the cached palette
+    if tuple(_px.defaults.color_discrete_sequence or ()) != palette:
+        _px.defaults.color_discrete_sequence = list(palette)
+
+
+# Altair color scales, built once per palette name
+_ALTAIR_SCALES = {}
 
 
 def get_altair_scale(palette_name='okabe_ito'):
@@ -243,7 +548,8 @@ def get_altair_scale(palette_name='okabe_ito'):
     Returns
     -------
     alt.Scale
-        Altair Scale object with the specified palette
+        Altair Scale object with the specified palette. The object is
+        cached and shared between calls, so it should not be modified.
     
     Examples
     --------
@@ -255,13 +561,24 @@ def get_altair_scale(palette_name='okabe_ito'):
     ...     color=alt.Color('category:N', scale=scale)
     ... )
     """
-    try:
-        import altair as alt
-    except ImportError:
+    if not _HAS_ALT:
         raise ImportError("altair is required for this function")
+    _load_altair()
     
-    palette = get_categorical_palette(palette_name)
-    return alt.Scale(range=palette)
+    scale = _ALTAIR_SCALES.get(palette_name)
+    if scale is None:
+        scale = _alt.Scale(range=list(get_categorical_palette(palette_name)))
+        _ALTAIR_SCALES[palette_name] = scale
+    return scale
+
+
+# Palette setters used by set_global_palettes, in the order of its
+# *_enabled flags, paired with whether the backing library is installed
+_GLOBAL_DISPATCH = (
+    (apply_matplotlib_palette, _HAS_MPL),
+    (set_seaborn_palette, _HAS_SNS),
+    (set_plotly_palette, _HAS_PX),
+)
 
 
 def set_global_palettes(
@@ -289,26 +606,16 @@ def set_global_palettes(
     >>> set_global_palettes('paul_tol_muted')
     >>> # Now all matplotlib and seaborn plots will use the palette
     """
-    if matplotlib_enabled:
-        try:
-            apply_matplotlib_palette(palette_name=palette_name)
-        except ImportError:
-            pass
-    
-    if seaborn_enabled:
-        try:
-            set_seaborn_palette(palette_name=palette_name)
-        except ImportError:
-            pass
+    enabled = (matplotlib_enabled, seaborn_enabled, plotly_enabled)
     
-    if plotly_enabled:
-        try:
-            set_plotly_palette(palette_name=palette_name)
-        except ImportError:
-            pass
+    # Libraries that are not installed are skipped silently
+    for (setter, available), flag in zip(_GLOBAL_DISPATCH, enabled):
+        if flag and available:
+            setter(palette_name=palette_name)
 
 
 # Utility function to generate CSS variables
+@functools.lru_cache(maxsize=64)
 def generate_css_variables(palette_name='okabe_ito', prefix='color'):
     """
     Generate CSS variable definitions for a palette.
@@ -334,10 +641,9 @@ def generate_css_variables(palette_name='okabe_ito', prefix='color'):
     ...
     """
     palette = get_categorical_palette(palette_name)
-    lines = []
-    for i, color in enumerate(palette, 1):
-        lines.append(f"  --{prefix}-{i}: {color};")
-    return "\n".join(lines)
+    return "\n".join(
+        f"  --{prefix}-{i}: {color};" for i, color in enumerate(palette, 1)
+    )
 
 
 if __name__ == "__main__":